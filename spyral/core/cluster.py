@@ -1,5 +1,6 @@
 from .point_cloud import PointCloud
 from .config import ClusterParameters
+from .constants import CLOUD_X, CLOUD_Z, CLOUD_INTEGRAL, CLOUD_SCALE
 import numpy as np
 from dataclasses import dataclass, field
 from sklearn.neighbors import LocalOutlierFactor
@@ -110,9 +111,9 @@ class Cluster:
         """
         cloud.sort_in_z()
         self.data = np.zeros((len(cloud.cloud), 5))
-        self.data[:, :3] = cloud.cloud[:, :3]  # position
-        self.data[:, 3] = cloud.cloud[:, 4]  # peak integral
-        self.data[:, 4] = cloud.cloud[:, 7]  # scale (big or small)
+        self.data[:, :3] = cloud.cloud[:, CLOUD_X : CLOUD_Z + 1]  # position
+        self.data[:, 3] = cloud.cloud[:, CLOUD_INTEGRAL]  # peak integral
+        self.data[:, 4] = cloud.cloud[:, CLOUD_SCALE]  # scale (big or small)
 
     def drop_outliers(self, scale: float = 0.05):
         """Use scikit-learn LocalOutlierFactor to test the cluster for spatial outliers.
@@ -1,6 +1,14 @@
 from .point_cloud import PointCloud
 from .cluster import LabeledCloud, Cluster, convert_labeled_to_cluster
 from .config import ClusterParameters
+from .constants import (
+    CLOUD_X,
+    CLOUD_Y,
+    CLOUD_Z,
+    CLOUD_INTEGRAL,
+    CLOUD_COLUMNS,
+    CLOUD_DTYPE,
+)
 from ..geometry.circle import least_squares_circle
 
 import sklearn.cluster as skcluster
@@ -65,7 +73,8 @@ def join_clusters_step(
     centers = np.zeros((len(clusters), 3))
     for idx, cluster in enumerate(clusters):
         centers[idx, 0], centers[idx, 1], centers[idx, 2], _ = least_squares_circle(
-            cluster.point_cloud.cloud[:, 0], cluster.point_cloud.cloud[:, 1]
+            cluster.point_cloud.cloud[:, CLOUD_X],
+            cluster.point_cloud.cloud[:, CLOUD_Y],
         )
 
     # Make a dictionary of center groups
@@ -133,8 +142,10 @@ def join_clusters_step(
                 )
 
             smaller_area = min(area, comp_area)
-            comp_mean_charge = np.mean(comp_cluster.point_cloud.cloud[:, 4], axis=0)
-            mean_charge = np.mean(cluster.point_cloud.cloud[:, 4], axis=0)
+            comp_mean_charge = np.mean(
+                comp_cluster.point_cloud.cloud[:, CLOUD_INTEGRAL], axis=0
+            )
+            mean_charge = np.mean(cluster.point_cloud.cloud[:, CLOUD_INTEGRAL], axis=0)
             charge_diff = np.abs(mean_charge - comp_mean_charge)
             threshold = params.fractional_charge_threshold * np.max(
                 [comp_mean_charge, mean_charge]
@@ -157,7 +168,7 @@ def join_clusters_step(
 
         new_cluster = LabeledCloud(g, PointCloud())
         new_cluster.point_cloud.event_number = event_number
-        new_cluster.point_cloud.cloud = np.zeros((0, 8))
+        new_cluster.point_cloud.cloud = np.zeros((0, CLOUD_COLUMNS), dtype=CLOUD_DTYPE)
         for idx in groups[g]:
             new_cluster.point_cloud.cloud = np.concatenate(
                 (new_cluster.point_cloud.cloud, clusters[idx].point_cloud.cloud), axis=0
@@ -197,7 +208,7 @@ def form_clusters(pc: PointCloud, params: ClusterParameters) -> list[LabeledClou
 
     Analyze a point cloud, and group the points into clusters which in principle should correspond to particle trajectories. This analysis contains several steps,
     and revolves around the HDBSCAN clustering algorithm implemented in scikit-learn (see [their description](https://scikit-learn.org/stable/modules/generated/sklearn.cluster.HDBSCAN.html) for details)
-    First the point cloud is smoothed by averaging over nearest neighbors (defined by the smoothing_neighbor_distance parameter) to remove small deviations.
+    First any points which lie outside of the detector are removed, and clouds which are too small (min_cloud_size) are rejected.
     The data is then scaled where each coordinate (x,y,z,int) is centered to its mean and then scaled to its std deviation using the scikit-learn StandardScaler. This data is then
     clustered by HDBSCAN and the clusters are returned.
 
@@ -214,7 +225,7 @@ def form_clusters(pc: PointCloud, params: ClusterParameters) -> list[LabeledClou
         List of clusters found by the algorithm with labels
     """
 
-    # Smooth out the point cloud by averaging over neighboring points within a distance, droping any duplicate points
+    # Remove any points outside the detector, and reject clouds too small to cluster
     pc.remove_illegal_points()
     if len(pc.cloud) < params.min_cloud_size:
         return []
@@ -226,7 +237,7 @@ def form_clusters(pc: PointCloud, params: ClusterParameters) -> list[LabeledClou
 
     # Use spatial dimensions and integrated charge
     cluster_data = np.empty(shape=(len(pc.cloud), 3))
-    cluster_data[:, :] = pc.cloud[:, :3]
+    cluster_data[:, :] = pc.cloud[:, CLOUD_X : CLOUD_Z + 1]
 
     # Unfiy feature ranges to their means and have standard variance (1)
     cluster_data[:, 2] *= 584.0 / 1000.0
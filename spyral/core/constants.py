@@ -36,11 +36,28 @@ C: float
     scipy alias, speed_of_light m/s
 E_CHARGE: float
     scipy alias, elementary_charge in Coulombs
+CLOUD_X, CLOUD_Y, CLOUD_Z: int
+    Point cloud column indices of the spatial coordinates (0, 1, 2)
+CLOUD_AMPLITUDE: int
+    Point cloud column index of the peak amplitude (3)
+CLOUD_INTEGRAL: int
+    Point cloud column index of the peak integral (4)
+CLOUD_PAD_ID: int
+    Point cloud column index of the pad id (5)
+CLOUD_TIME: int
+    Point cloud column index of the corrected time bucket (6)
+CLOUD_SCALE: int
+    Point cloud column index of the pad scale (7)
+CLOUD_COLUMNS: int
+    Number of columns in a point cloud, 8
+CLOUD_DTYPE: type
+    Storage type of point cloud data, numpy float32. Pad ids are exact; fractional values
+    below 1024 (positions in mm, time buckets) are rounded by at most ~3e-5
 """
 
 from scipy.constants import physical_constants
 from scipy.constants import speed_of_light, elementary_charge
-from numpy import pi
+from numpy import pi, float32
 
 INVALID_PEAK_CENTROID: float = -1.0
 
@@ -84,3 +101,15 @@ QBRHO_2_P: float = 1.0e-9 * 10.0 * 100.0 * speed_of_light  # T * m -> MeV/c^2
 C = speed_of_light  # m/s
 
 E_CHARGE = elementary_charge  # Coulombs
+
+# Point cloud array columns
+CLOUD_X: int = 0
+CLOUD_Y: int = 1
+CLOUD_Z: int = 2
+CLOUD_AMPLITUDE: int = 3
+CLOUD_INTEGRAL: int = 4
+CLOUD_PAD_ID: int = 5
+CLOUD_TIME: int = 6
+CLOUD_SCALE: int = 7
+CLOUD_COLUMNS: int = 8
+CLOUD_DTYPE: type = float32
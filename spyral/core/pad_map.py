@@ -2,6 +2,7 @@ from .constants import INVALID_PAD_ID
 from .hardware_id import HardwareID, generate_electronics_id
 from pathlib import Path
 from dataclasses import dataclass, field
+import numpy as np
 
 from .legacy_beam_pads import LEGACY_BEAM_PADS
 
@@ -34,6 +35,36 @@ class PadData:
     hardware: HardwareID = field(default_factory=HardwareID)
 
 
+@dataclass
+class PadLUT:
+    """Dataclass of pad information as arrays indexed by pad number
+
+    Used for fast bulk lookups of pad data (i.e. when building point clouds)
+
+    Attributes
+    ----------
+    x: ndarray
+        The pad x-coordinates
+    y: ndarray
+        The pad y-coordinates
+    gain: ndarray
+        The relative pad gains
+    time_offset: ndarray
+        The pad time offsets due to GET electronics
+    scale: ndarray
+        The pad scales (big pad or small pad)
+    valid: ndarray
+        True if the pad exists in the map and is not a beam pad
+    """
+
+    x: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    y: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    gain: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    time_offset: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    scale: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    valid: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+
+
 class PadMap:
     """A map of pad number to PadData
 
@@ -43,6 +74,8 @@ class PadMap:
         The forward map (pad number -> PadData)
     elec_map: dict[int -> int]
         Essentially a reverse map of HardwareID -> pad number
+    lut: PadLUT
+        The pad data as arrays indexed by pad number
 
     Methods
     -------
@@ -54,6 +87,8 @@ class PadMap:
         Get the PadData for a given pad. Returns None if the pad does not exist
     get_pad_from_hardware(hardware: HardwareID) -> int | None
         Get the pad number for a given HardwareID. Returns None if the HardwareID is invalid
+    build_lut() -> PadLUT
+        Build the array lookup table of the pad data
 
     """
 
@@ -90,6 +125,7 @@ class PadMap:
         self.load(
             geometry_path, gain_path, time_correction_path, electronics_path, scale_path
         )
+        self.lut: PadLUT = self.build_lut()
 
     def load(
         self,
@@ -192,11 +228,36 @@ class PadMap:
             The associated pad number, or None if the HardwareID is invalid
 
         """
-        key = generate_electronics_id(hardware)
-        if key in self.elec_map.keys():
-            return self.elec_map[generate_electronics_id(hardware)]
-
-        return None
+        return self.elec_map.get(generate_electronics_id(hardware))
 
     def is_beam_pad(self, pad_id: int) -> bool:
         return pad_id in LEGACY_BEAM_PADS
+
+    def build_lut(self) -> PadLUT:
+        """Build the array lookup table of the pad data
+
+        Each array is indexed by pad number and has length max pad number + 1.
+        Pads which are missing from the map or are beam pads are marked invalid.
+
+        Returns
+        -------
+        PadLUT
+            The lookup table
+        """
+        size = max(self.map.keys(), default=-1) + 1
+        lut = PadLUT(
+            x=np.zeros(size),
+            y=np.zeros(size),
+            gain=np.ones(size),
+            time_offset=np.zeros(size),
+            scale=np.zeros(size),
+            valid=np.zeros(size, dtype=bool),
+        )
+        for pad_number, pad in self.map.items():
+            lut.x[pad_number] = pad.x
+            lut.y[pad_number] = pad.y
+            lut.gain[pad_number] = pad.gain
+            lut.time_offset[pad_number] = pad.time_offset
+            lut.scale[pad_number] = pad.scale
+            lut.valid[pad_number] = not self.is_beam_pad(pad_number)
+        return lut
@@ -1,5 +1,17 @@
 from .pad_map import PadMap
-from .constants import INVALID_EVENT_NUMBER
+from .constants import (
+    INVALID_EVENT_NUMBER,
+    CLOUD_X,
+    CLOUD_Y,
+    CLOUD_Z,
+    CLOUD_AMPLITUDE,
+    CLOUD_INTEGRAL,
+    CLOUD_PAD_ID,
+    CLOUD_TIME,
+    CLOUD_SCALE,
+    CLOUD_COLUMNS,
+    CLOUD_DTYPE,
+)
 from ..correction import ElectronCorrector
 from ..trace.get_event import GetEvent
 from ..trace.get_legacy_event import GetLegacyEvent
@@ -20,7 +32,8 @@ class PointCloud:
         The event number
     cloud: ndarray
         The Nx8 array of points in AT-TPC space
-        Each row is [x,y,z,amplitude,integral,pad id,time,scale]
+        Each row is [x,y,z,amplitude,integral,pad id,time,scale]; see the CLOUD_* column
+        constants in spyral.core.constants
 
     Methods
     -------
@@ -51,7 +64,7 @@ class PointCloud:
             An empty point cloud
         """
         self.event_number: int = INVALID_EVENT_NUMBER
-        self.cloud: np.ndarray = np.empty(0, dtype=np.float64)
+        self.cloud: np.ndarray = np.empty(0, dtype=CLOUD_DTYPE)
 
     def load_cloud_from_get_event(
         self,
@@ -71,13 +84,17 @@ class PointCloud:
             The PadMap used to get pad correction values
         """
         self.event_number = event.number
-        count = 0
+        lut = pmap.lut
+        # Gather the peak data of the good traces, then fill the cloud columns once for the event
+        pads: list[int] = []
+        pad_ids: list[int] = []
+        counts: list[int] = []
+        centroids: list[np.ndarray] = []
+        amplitudes: list[np.ndarray] = []
+        integrals: list[np.ndarray] = []
         for trace in event.traces:
-            count += trace.get_number_of_peaks()
-        self.cloud = np.zeros((count, 8))
-        idx = 0
-        for trace in event.traces:
-            if trace.get_number_of_peaks() == 0 or trace.get_number_of_peaks() > 5:
+            n_peaks = trace.get_number_of_peaks()
+            if n_peaks == 0 or n_peaks > 5:
                 continue
 
             pid = trace.hw_id.pad_id
@@ -93,24 +110,36 @@ class PointCloud:
             ):  # This is dangerous! We trust the pad map over the merged data!
                 pid = check
 
-            pad = pmap.get_pad_data(check)
-            if pad is None or pmap.is_beam_pad(check):
+            if not lut.valid[check]:
                 continue
-            for peak in trace.get_peaks():
-                self.cloud[idx, 0] = pad.x  # X-coordinate, geometry
-                self.cloud[idx, 1] = pad.y  # Y-coordinate, geometry
-                self.cloud[idx, 2] = (
-                    peak.centroid + pad.time_offset
-                )  # Z-coordinate, time with correction until calibrated with calibrate_z_position()
-                self.cloud[idx, 3] = peak.amplitude
-                self.cloud[idx, 4] = peak.integral * pad.gain
-                self.cloud[idx, 5] = trace.hw_id.pad_id
-                self.cloud[idx, 6] = (
-                    peak.centroid + pad.time_offset
-                )  # Time bucket with correction
-                self.cloud[idx, 7] = pad.scale
-                idx += 1
-        self.cloud = self.cloud[self.cloud[:, 3] != 0.0]
+
+            trace_centroids, trace_amplitudes, trace_integrals = (
+                trace.get_peaks_as_arrays()
+            )
+            pads.append(check)
+            pad_ids.append(trace.hw_id.pad_id)
+            counts.append(n_peaks)
+            centroids.append(trace_centroids)
+            amplitudes.append(trace_amplitudes)
+            integrals.append(trace_integrals)
+
+        if len(pads) == 0:
+            self.cloud = np.empty((0, CLOUD_COLUMNS), dtype=CLOUD_DTYPE)
+            return
+
+        pad = np.repeat(pads, counts)
+        self.cloud = np.empty((len(pad), CLOUD_COLUMNS), dtype=CLOUD_DTYPE)
+        self.cloud[:, CLOUD_X] = lut.x[pad]  # X-coordinate, geometry
+        self.cloud[:, CLOUD_Y] = lut.y[pad]  # Y-coordinate, geometry
+        # Z-coordinate is the time with correction until calibrated with calibrate_z_position()
+        self.cloud[:, CLOUD_Z] = self.cloud[:, CLOUD_TIME] = (
+            np.concatenate(centroids) + lut.time_offset[pad]
+        )
+        self.cloud[:, CLOUD_AMPLITUDE] = np.concatenate(amplitudes)
+        self.cloud[:, CLOUD_INTEGRAL] = np.concatenate(integrals) * lut.gain[pad]
+        self.cloud[:, CLOUD_PAD_ID] = np.repeat(pad_ids, counts)
+        self.cloud[:, CLOUD_SCALE] = lut.scale[pad]
+        self.cloud = self.cloud[self.cloud[:, CLOUD_AMPLITUDE] != 0.0]
 
     def load_cloud_from_hdf5_data(self, data: np.ndarray, event_number: int):
         """Load a point cloud from an hdf5 file dataset
@@ -144,7 +173,7 @@ class PointCloud:
         ndarray
             An Nx3 array of the spatial data of the PointCloud
         """
-        return self.cloud[:, 0:3]
+        return self.cloud[:, CLOUD_X : CLOUD_Z + 1]
 
     def calibrate_z_position(
         self,
@@ -173,14 +202,13 @@ class PointCloud:
             The ion chamber time correction in GET Time Buckets
         """
         # Maybe use mm as the reference because it is more stable?
-        for idx, point in enumerate(self.cloud):
-            self.cloud[idx][2] = (
-                (window_tb - (point[6] - ic_correction))
-                / (window_tb - micromegas_tb)
-                * detector_length
-            )
-            if efield_correction is not None:
-                self.cloud[idx] = efield_correction.correct_point(self.cloud[idx])
+        self.cloud[:, CLOUD_Z] = (
+            (window_tb - (self.cloud[:, CLOUD_TIME] - ic_correction))
+            / (window_tb - micromegas_tb)
+            * detector_length
+        )
+        if efield_correction is not None:
+            efield_correction.correct_points(self.cloud)
 
     def remove_illegal_points(self, detector_length: float = 1000.0):
         """Remove any points which lie outside the legal detector bounds in z
@@ -193,11 +221,11 @@ class PointCloud:
 
         """
         mask = np.logical_and(
-            self.cloud[:, 2] < detector_length, self.cloud[:, 2] > 0.0
+            self.cloud[:, CLOUD_Z] < detector_length, self.cloud[:, CLOUD_Z] > 0.0
         )
         self.cloud = self.cloud[mask]
 
     def sort_in_z(self):
         """Sort the internal point cloud array by the z-coordinate"""
-        indicies = np.argsort(self.cloud[:, 2])
+        indicies = np.argsort(self.cloud[:, CLOUD_Z])
         self.cloud = self.cloud[indicies]
@@ -0,0 +1,258 @@
+from .point_cloud import PointCloud
+from .constants import CLOUD_COLUMNS, CLOUD_DTYPE
+
+import h5py as h5
+import numpy as np
+
+# Per-event ion chamber data stored alongside the point clouds
+IC_DATASETS: tuple[str, str, str, str] = (
+    "ic_amplitude",
+    "ic_integral",
+    "ic_centroid",
+    "ic_multiplicity",
+)
+
+# Rows per chunk of the points dataset. Chunks span whole rows and hold a few events each,
+# so appending or reading an event touches one or two chunks (8 * 4096 * 4 bytes = 128 kB,
+# which fits in the default 1 MB hdf5 chunk cache)
+POINTS_CHUNK_ROWS: int = 4096
+
+
+class PointCloudWriter:
+    """Writes point clouds into a hdf5 group using a ragged layout
+
+    Rather than writing one dataset per event, all of the point clouds are appended to a single
+    (N, CLOUD_COLUMNS) dataset named `points`. An `offsets` dataset of length n_events+1 indexes the data,
+    such that the cloud for event number e is `points[offsets[e - min_event]:offsets[e - min_event + 1]]`.
+    An `exists` dataset flags which events were actually written, and the ion chamber data is stored as
+    one 1-D dataset per value (see IC_DATASETS).
+
+    Clouds must be written in ascending event order; write_cloud raises an Exception otherwise.
+
+    Attributes
+    ----------
+    group: h5py.Group
+        The group the data is written to
+    min_event: int
+        The first event number
+    max_event: int
+        The last event number
+    points: h5py.Dataset
+        The dataset containing all of the point cloud data
+    sizes: ndarray
+        The number of points in each event
+    exists: ndarray
+        Flag indicating if an event was written
+    ic_data: dict[str, ndarray]
+        The ion chamber data for each event
+    last_event: int
+        The event number of the last written cloud
+
+    Methods
+    -------
+    PointCloudWriter(group: h5py.Group, min_event: int, max_event: int)
+        Construct the writer and create the points dataset
+    write_cloud(pc: PointCloud)
+        Append a point cloud to the points dataset
+    set_ic(event_number: int, amplitude: float, integral: float, centroid: float, multiplicity: float)
+        Set the ion chamber data for an event
+    close()
+        Write the index and ion chamber datasets
+    """
+
+    def __init__(self, group: h5.Group, min_event: int, max_event: int):
+        """Construct the writer and create the points dataset
+
+        Parameters
+        ----------
+        group: h5py.Group
+            The group the data is written to
+        min_event: int
+            The first event number
+        max_event: int
+            The last event number
+
+        Returns
+        -------
+        PointCloudWriter
+            An instance of the class
+        """
+        self.group = group
+        self.min_event = min_event
+        self.max_event = max_event
+        self.group.attrs["min_event"] = min_event
+        self.group.attrs["max_event"] = max_event
+
+        n_events = max_event - min_event + 1
+        self.points: h5.Dataset = self.group.create_dataset(
+            "points",
+            shape=(0, CLOUD_COLUMNS),
+            maxshape=(None, CLOUD_COLUMNS),
+            chunks=(POINTS_CHUNK_ROWS, CLOUD_COLUMNS),
+            dtype=CLOUD_DTYPE,
+        )
+        self.sizes: np.ndarray = np.zeros(n_events, dtype=np.int64)
+        self.exists: np.ndarray = np.zeros(n_events, dtype=bool)
+        # default IC settings
+        self.ic_data: dict[str, np.ndarray] = {
+            name: np.full(n_events, -1.0) for name in IC_DATASETS
+        }
+        self.last_event: int = min_event - 1
+
+    def write_cloud(self, pc: PointCloud):
+        """Append a point cloud to the points dataset
+
+        Parameters
+        ----------
+        pc: PointCloud
+            The point cloud to write. Its event number is used to index the data
+            and must be greater than that of the previously written cloud
+        """
+        # The offsets are built in event order, so the points must be appended in event order
+        if pc.event_number <= self.last_event:
+            raise Exception(
+                f"PointCloudWriter was given event {pc.event_number} after event {self.last_event}! Clouds must be written in ascending event order"
+            )
+        self.last_event = pc.event_number
+        local = pc.event_number - self.min_event
+        n_points = len(pc.cloud)
+        self.sizes[local] = n_points
+        self.exists[local] = True
+        if n_points == 0:
+            return
+        start = self.points.shape[0]
+        self.points.resize(start + n_points, axis=0)
+        self.points[start:] = pc.cloud
+
+    def set_ic(
+        self,
+        event_number: int,
+        amplitude: float,
+        integral: float,
+        centroid: float,
+        multiplicity: float,
+    ):
+        """Set the ion chamber data for an event
+
+        Parameters
+        ----------
+        event_number: int
+            The event number
+        amplitude: float
+            The IC peak amplitude
+        integral: float
+            The IC peak integral
+        centroid: float
+            The IC peak centroid
+        multiplicity: float
+            The IC multiplicity
+        """
+        local = event_number - self.min_event
+        self.ic_data["ic_amplitude"][local] = amplitude
+        self.ic_data["ic_integral"][local] = integral
+        self.ic_data["ic_centroid"][local] = centroid
+        self.ic_data["ic_multiplicity"][local] = multiplicity
+
+    def close(self):
+        """Write the index and ion chamber datasets
+
+        Must be called once all of the clouds have been written
+        """
+        offsets = np.zeros(len(self.sizes) + 1, dtype=np.int64)
+        np.cumsum(self.sizes, out=offsets[1:])
+        self.group.create_dataset("offsets", data=offsets)
+        self.group.create_dataset("exists", data=self.exists)
+        for name, values in self.ic_data.items():
+            self.group.create_dataset(name, data=values)
+
+
+class PointCloudReader:
+    """Reads point clouds written by a PointCloudWriter
+
+    The index and ion chamber data are loaded into memory on construction;
+    the point data is read event by event.
+
+    Attributes
+    ----------
+    min_event: int
+        The first event number
+    max_event: int
+        The last event number
+    points: h5py.Dataset
+        The dataset containing all of the point cloud data
+    offsets: ndarray
+        The index of each event into the points dataset
+    exists: ndarray
+        Flag indicating if an event was written
+    ic_data: dict[str, ndarray]
+        The ion chamber data for each event
+
+    Methods
+    -------
+    PointCloudReader(group: h5py.Group)
+        Construct the reader and load the index
+    read_cloud(event_number: int) -> PointCloud | None
+        Read the point cloud for an event
+    get_ic_data(event_number: int) -> dict[str, float]
+        Get the ion chamber data for an event
+    """
+
+    def __init__(self, group: h5.Group):
+        """Construct the reader and load the index
+
+        Parameters
+        ----------
+        group: h5py.Group
+            The group the data was written to
+
+        Returns
+        -------
+        PointCloudReader
+            An instance of the class
+        """
+        self.min_event: int = int(group.attrs["min_event"])  # type: ignore
+        self.max_event: int = int(group.attrs["max_event"])  # type: ignore
+        self.points: h5.Dataset = group["points"]  # type: ignore
+        self.offsets: np.ndarray = group["offsets"][:]  # type: ignore
+        self.exists: np.ndarray = group["exists"][:]  # type: ignore
+        self.ic_data: dict[str, np.ndarray] = {
+            name: group[name][:] for name in IC_DATASETS  # type: ignore
+        }
+
+    def read_cloud(self, event_number: int) -> PointCloud | None:
+        """Read the point cloud for an event
+
+        Parameters
+        ----------
+        event_number: int
+            The event number
+
+        Returns
+        -------
+        PointCloud | None
+            The point cloud, or None if the event does not exist
+        """
+        local = event_number - self.min_event
+        if local < 0 or local >= len(self.exists) or not self.exists[local]:
+            return None
+        pc = PointCloud()
+        pc.load_cloud_from_hdf5_data(
+            self.points[self.offsets[local] : self.offsets[local + 1]], event_number
+        )
+        return pc
+
+    def get_ic_data(self, event_number: int) -> dict[str, float]:
+        """Get the ion chamber data for an event
+
+        Parameters
+        ----------
+        event_number: int
+            The event number
+
+        Returns
+        -------
+        dict[str, float]
+            The ion chamber data, keyed by the names in IC_DATASETS
+        """
+        local = event_number - self.min_event
+        return {name: float(values[local]) for name, values in self.ic_data.items()}
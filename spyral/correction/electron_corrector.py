@@ -1,7 +1,17 @@
-from ..interpolate import BilinearInterpolator, clamp
+from ..interpolate import BilinearInterpolator, bilinear_interpolate_batch
+from ..core.constants import CLOUD_X, CLOUD_Y, CLOUD_Z
 from pathlib import Path
 import numpy as np
 
+# Garfield correction grid bounds, rho (mm) and z (mm)
+RHO_BIN_MIN: float = 0.0
+RHO_BIN_MAX: float = 275.0
+RHO_BINS: int = 276
+
+Z_BIN_MIN: float = 0.0
+Z_BIN_MAX: float = 1000.0
+Z_BINS: int = 1001
+
 
 class ElectronCorrector:
     """Class which uses a BilinearInterpolator to correct the drift time of electrons
@@ -19,6 +29,8 @@ class ElectronCorrector:
         Construct the corrector
     correct_point(point: ndarray) -> ndarray
         Apply the correction to a point in a point cloud
+    correct_points(cloud: ndarray) -> ndarray
+        Apply the correction to all of the points in a point cloud
 
     """
 
@@ -40,6 +52,8 @@ class ElectronCorrector:
     def correct_point(self, point: np.ndarray) -> np.ndarray:
         """Apply the correction to a point in a point cloud
 
+        Uses the same interpolation as correct_points
+
         Parameters
         ----------
         point: ndarray
@@ -50,27 +64,61 @@ class ElectronCorrector:
         ndarray
             The corrected point
         """
-        # Correction returns [rho_cor, trans_cor, z_cor]
-        corrected_point = np.zeros(len(point))
-        corrected_point[3:] = point[3:]
+        corrected = np.array(point, dtype=np.float64).reshape(1, len(point))
+        return self.correct_points(corrected)[0]
 
-        radius: float = np.linalg.norm(point[:2])  # type: ignore
-        azimuthal: float = np.arctan2(point[1], point[0])
+    def correct_points(self, cloud: np.ndarray) -> np.ndarray:
+        """Apply the correction to all of the points in a point cloud
 
-        correction = self.correction.interpolate(radius, point[2])
+        The correction is applied in place.
 
-        z_correction = clamp(correction[2], 0.0, 1000.0)
+        Parameters
+        ----------
+        cloud: ndarray
+            The Nx8 point cloud array to be corrected
+
+        Returns
+        -------
+        ndarray
+            The corrected point cloud array (the same array which was given)
+        """
+        # Work in double precision and cast back to the cloud type on assignment
+        x = cloud[:, CLOUD_X].astype(np.float64)
+        y = cloud[:, CLOUD_Y].astype(np.float64)
+        z = cloud[:, CLOUD_Z].astype(np.float64)
+        # Correction returns [rho_cor, trans_cor, z_cor]
+        radius = np.hypot(x, y)
+        azimuthal = np.arctan2(y, x)
+
+        interp = self.correction
+        correction = bilinear_interpolate_batch(
+            interp.values,
+            radius,
+            z,
+            interp.x_min,
+            interp.x_max,
+            interp.x_width,
+            interp.y_min,
+            interp.y_max,
+            interp.y_width,
+            interp.nan,
+        )
+
+        # NaN (off-grid) z corrections are treated as no correction
+        z_correction = np.nan_to_num(np.clip(correction[:, 2], 0.0, 1000.0), nan=0.0)
 
         corrected_radius = np.sqrt(
-            (radius + correction[0]) ** 2.0 + correction[1] ** 2.0
+            (radius + correction[:, 0]) ** 2.0 + correction[:, 1] ** 2.0
+        )
+        corrected_azim = azimuthal + np.arctan2(
+            correction[:, 1], (radius + correction[:, 0])
         )
-        corrected_azim = azimuthal + np.arctan2(correction[1], (radius + correction[0]))
 
-        corrected_point[0] = corrected_radius * np.cos(corrected_azim)
-        corrected_point[1] = corrected_radius * np.sin(corrected_azim)
-        corrected_point[2] = point[2] - z_correction
+        cloud[:, CLOUD_X] = corrected_radius * np.cos(corrected_azim)
+        cloud[:, CLOUD_Y] = corrected_radius * np.sin(corrected_azim)
+        cloud[:, CLOUD_Z] = z - z_correction
 
-        return corrected_point
+        return cloud
 
 
 def create_electron_corrector(ecorr_path: Path) -> ElectronCorrector:
@@ -87,17 +135,9 @@ def create_electron_corrector(ecorr_path: Path) -> ElectronCorrector:
         The corrector object
 
     """
-    rho_bin_min = 0.0
-    rho_bin_max = 275.0
-    rho_bins = 276
-
-    z_bin_min = 0.0
-    z_bin_max = 1000.0
-    z_bins = 1001
-
     grid: np.ndarray = np.load(ecorr_path)
 
     interpolator = BilinearInterpolator(
-        rho_bin_min, rho_bin_max, rho_bins, z_bin_min, z_bin_max, z_bins, grid
+        RHO_BIN_MIN, RHO_BIN_MAX, RHO_BINS, Z_BIN_MIN, Z_BIN_MAX, Z_BINS, grid
     )
     return ElectronCorrector(interpolator)
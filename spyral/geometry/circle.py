@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def generate_circle_points(
     center_x: float, center_y: float, radius: float
 ) -> np.ndarray:
@@ -33,7 +33,7 @@ def generate_circle_points(
     return array
 
 
-@njit
+@njit(cache=True)
 def least_squares_circle(
     x: np.ndarray, y: np.ndarray
 ) -> tuple[float, float, float, float]:
@@ -1,2 +1,2 @@
-from .bilinear import BilinearInterpolator, clamp
+from .bilinear import BilinearInterpolator, bilinear_interpolate_batch, clamp
 from .linear import LinearInterpolator
@@ -4,7 +4,7 @@ from numba import njit, int32, float64, boolean
 from numba.experimental import jitclass
 
 
-@njit
+@njit(cache=True)
 def clamp(value: float | int, low: float | int, hi: float | int) -> float | int:
     """Clamp a value to a range
 
@@ -86,6 +86,8 @@ class BilinearInterpolator:
         Internal consistency check of the grid. Raises an Exception if check fails.
     interpolate(x: float, y: float) -> np.ndarray
         Interpolate on a given coordinate (x,y)
+
+    For interpolating many points at once, pass the interpolator members to bilinear_interpolate_batch
     """
 
     def __init__(
@@ -251,3 +253,81 @@ class BilinearInterpolator:
                 + q12 * (x2x) * (yy1)
                 + q22 * (xx1) * (yy1)
             ) / ((x2 - x1) * (y2 - y1))
+
+
+@njit(cache=True)
+def bilinear_interpolate_batch(
+    values: np.ndarray,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    x_min: float,
+    x_max: float,
+    x_width: float,
+    y_min: float,
+    y_max: float,
+    y_width: float,
+    nan: bool,
+) -> np.ndarray:
+    """Bilinear interpolation on a regular grid for a set of coordinates (x,y)
+
+    The batch equivalent of BilinearInterpolator.interpolate; the arguments are the members of a
+    BilinearInterpolator. Jitclasses cannot be cached, so this is a free function, which can be.
+
+    Points on the upper edge of the grid are interpolated within the last grid cell, so every
+    point uses the same four-corner weighting.
+
+    Parameters
+    ----------
+    values: ndarray
+        The NxMxP grid of data to interpolate on
+    xs: ndarray
+        The x-coordinates of the points to interpolate
+    ys: ndarray
+        The y-coordinates of the points to interpolate
+    x_min: float
+        Minimum value of the x-coordinate for the grid
+    x_max: float
+        Maximum value of the x-coordinate for the grid
+    x_width: float
+        Width of a grid cell in the x-coordinate
+    y_min: float
+        Minimum value of the y-coordinate for the grid
+    y_max: float
+        Maximum value of the y-coordinate for the grid
+    y_width: float
+        Width of a grid cell in the y-coordinate
+    nan: bool
+        If True, points outside of the grid result in NaN values. Otherwise they are clamped to the grid edge
+
+    Returns
+    -------
+    ndarray
+        An NxP array of the interpolated values, where N is the number of points
+    """
+    n_xbins = values.shape[0]
+    n_ybins = values.shape[1]
+    n_values = values.shape[2]
+    results = np.empty((len(xs), n_values))
+    for idx in range(len(xs)):
+        x = xs[idx]
+        y = ys[idx]
+        if nan and (x > x_max or x < x_min or y > y_max or y < y_min):
+            results[idx, :] = np.nan
+            continue
+        x = min(max(x, x_min), x_max)
+        y = min(max(y, y_min), y_max)
+
+        fx = (x - x_min) / x_width
+        fy = (y - y_min) / y_width
+        i = min(max(int(math.floor(fx)), 0), n_xbins - 2)
+        j = min(max(int(math.floor(fy)), 0), n_ybins - 2)
+        tx = min(max(fx - i, 0.0), 1.0)
+        ty = min(max(fy - j, 0.0), 1.0)
+        for k in range(n_values):
+            results[idx, k] = (
+                values[i, j, k] * (1.0 - tx) * (1.0 - ty)
+                + values[i + 1, j, k] * tx * (1.0 - ty)
+                + values[i, j + 1, k] * (1.0 - tx) * ty
+                + values[i + 1, j + 1, k] * tx * ty
+            )
+    return results
@@ -1,5 +1,5 @@
 from .core.config import ClusterParameters
-from .core.point_cloud import PointCloud
+from .core.point_cloud_file import PointCloudReader
 from .core.clusterize import form_clusters, join_clusters, cleanup_clusters
 from .core.workspace import Workspace
 from .parallel.status_message import StatusMessage, Phase
@@ -49,9 +49,16 @@ def phase_cluster(
     if not isinstance(cloud_group, h5.Group):
         spyral_error(__name__, f"Point cloud group not present in run {run}!")
         return
+    if "points" not in cloud_group or "offsets" not in cloud_group:
+        spyral_error(
+            __name__,
+            f"Point cloud file for run {run} uses the old per-event layout, re-run phase 1!",
+        )
+        return
 
-    min_event: int = cloud_group.attrs["min_event"]  # type: ignore
-    max_event: int = cloud_group.attrs["max_event"]  # type: ignore
+    reader = PointCloudReader(cloud_group)
+    min_event = reader.min_event
+    max_event = reader.max_event
     cluster_group: h5.Group = cluster_file.create_group("cluster")
     cluster_group.attrs["min_event"] = min_event
     cluster_group.attrs["max_event"] = max_event
@@ -78,18 +85,10 @@ def phase_cluster(
             count = 0
             queue.put(msg)
 
-        cloud_data: h5.Dataset | None = None
-        try:
-            cloud_data = cloud_group[f"cloud_{idx}"]  # type: ignore
-        except Exception:
+        cloud = reader.read_cloud(idx)
+        if cloud is None:
             continue
 
-        if cloud_data is None:
-            continue
-
-        cloud = PointCloud()
-        cloud.load_cloud_from_hdf5_data(cloud_data[:].copy(), idx)
-
         clusters = form_clusters(cloud, cluster_params)
         joined = join_clusters(clusters, cluster_params)
         cleaned = cleanup_clusters(joined, cluster_params)
@@ -97,12 +96,8 @@ def phase_cluster(
         # Each event can contain many clusters
         cluster_event_group = cluster_group.create_group(f"event_{idx}")
         cluster_event_group.attrs["nclusters"] = len(cleaned)
-        cluster_event_group.attrs["ic_amplitude"] = cloud_data.attrs["ic_amplitude"]
-        cluster_event_group.attrs["ic_centroid"] = cloud_data.attrs["ic_centroid"]
-        cluster_event_group.attrs["ic_integral"] = cloud_data.attrs["ic_integral"]
-        cluster_event_group.attrs["ic_multiplicity"] = cloud_data.attrs[
-            "ic_multiplicity"
-        ]
+        for name, value in reader.get_ic_data(idx).items():
+            cluster_event_group.attrs[name] = value
         for cidx, cluster in enumerate(cleaned):
             local_group = cluster_event_group.create_group(f"cluster_{cidx}")
             local_group.attrs["label"] = cluster.label
@@ -1,6 +1,7 @@
 from .core.config import GetParameters, DetectorParameters, FribParameters
 from .core.pad_map import PadMap
 from .core.point_cloud import PointCloud
+from .core.point_cloud_file import PointCloudWriter
 from .core.workspace import Workspace
 from .trace.frib_event import FribEvent
 from .trace.get_event import GetEvent
@@ -122,8 +123,7 @@ def phase_pointcloud(
         )
         frib_scaler_group = None
     cloud_group = point_file.create_group("cloud")
-    cloud_group.attrs["min_event"] = min_event
-    cloud_group.attrs["max_event"] = max_event
+    writer = PointCloudWriter(cloud_group, min_event, max_event)
 
     nevents = max_event - min_event
     total: int
@@ -139,6 +139,18 @@ def phase_pointcloud(
     count = 0
     msg = StatusMessage(run, Phase.CLOUD, total, 1)  # We always increment by 1
 
+    # Gather the existing events once, rather than probing for each event
+    event_names = set(event_group.keys())
+    frib_event_names = set(frib_evt_group.keys())
+
+    # Calibration and IC parameters, constant over the run
+    micromegas_tb = detector_params.micromegas_time_bucket
+    window_tb = detector_params.window_time_bucket
+    detector_length = detector_params.detector_length
+    get_frequency = detector_params.get_frequency
+    correct_ic_time = frib_params.correct_ic_time
+    ic_multiplicity_limit = frib_params.ic_multiplicity
+
     # Process the data
     for idx in range(min_event, max_event + 1):
         count += 1
@@ -146,105 +158,63 @@ def phase_pointcloud(
             count = 0
             queue.put(msg)
 
-        event_data: h5.Dataset
-        try:
-            event_data = event_group[f"evt{idx}_data"]  # type: ignore
-        except Exception:
+        event_name = f"evt{idx}_data"
+        if event_name not in event_names:
             continue
+        event_data: h5.Dataset = event_group[event_name]  # type: ignore
 
         event = GetEvent(event_data, idx, get_params, rng)
 
         pc = PointCloud()
         pc.load_cloud_from_get_event(event, pad_map)
 
-        pc_dataset = cloud_group.create_dataset(
-            f"cloud_{pc.event_number}", shape=pc.cloud.shape, dtype=np.float64
-        )
-
-        # default IC settings
-        pc_dataset.attrs["ic_amplitude"] = -1.0
-        pc_dataset.attrs["ic_integral"] = -1.0
-        pc_dataset.attrs["ic_centroid"] = -1.0
-        pc_dataset.attrs["ic_multiplicity"] = -1.0
-
-        # Now analyze FRIBDAQ data
-        frib_data: h5.Dataset
-        try:
-            frib_data = frib_evt_group[f"evt{idx}_1903"]  # type: ignore
-        except Exception:
-            pc.calibrate_z_position(
-                detector_params.micromegas_time_bucket,
-                detector_params.window_time_bucket,
-                detector_params.detector_length,
-                corrector,
-            )
-            pc_dataset[:] = pc.cloud
-            continue
-
-        frib_event = FribEvent(frib_data, idx, frib_params)
-        # Handle IC analysis cases
-        # First check if IC correction is not on
-        if frib_params.correct_ic_time:
-            # IC correction is on, extract good IC peak with Si coincidence imposed
-            good_ic = frib_event.get_good_ic_peak(frib_params)
-            if good_ic is None:
-                # There is no good IC peak, skip
-                pc.calibrate_z_position(
-                    detector_params.micromegas_time_bucket,
-                    detector_params.window_time_bucket,
-                    detector_params.detector_length,
-                    corrector,
-                )
-                pc_dataset[:] = pc.cloud
-                continue
-            # Good IC found, get the peak and multiplicity
-            peak = good_ic[1]
-            mult = good_ic[0]
-            pc_dataset.attrs["ic_amplitude"] = peak.amplitude
-            pc_dataset.attrs["ic_integral"] = peak.integral
-            pc_dataset.attrs["ic_centroid"] = peak.centroid
-            pc_dataset.attrs["ic_multiplicity"] = mult
-
-            ic_cor = frib_event.correct_ic_time(
-                peak, frib_params, detector_params.get_frequency
-            )
-            # Apply IC correction to time calibration, if correction is less than the
-            # total length of the GET window in TB
-            if ic_cor < 512.0:
-                pc.calibrate_z_position(
-                    detector_params.micromegas_time_bucket,
-                    detector_params.window_time_bucket,
-                    detector_params.detector_length,
-                    corrector,
-                    ic_cor,
-                )
+        # Now analyze FRIBDAQ data, if present. No IC time correction by default
+        ic_cor = 0.0
+        frib_name = f"evt{idx}_1903"
+        if frib_name in frib_event_names:
+            frib_data: h5.Dataset = frib_evt_group[frib_name]  # type: ignore
+            frib_event = FribEvent(frib_data, idx, frib_params)
+            # Handle IC analysis cases
+            # First check if IC correction is not on
+            if correct_ic_time:
+                # IC correction is on, extract good IC peak with Si coincidence imposed
+                # If there is no good IC peak, no correction is applied
+                good_ic = frib_event.get_good_ic_peak(frib_params)
+                if good_ic is not None:
+                    # Good IC found, get the peak and multiplicity
+                    peak = good_ic[1]
+                    mult = good_ic[0]
+                    writer.set_ic(
+                        idx, peak.amplitude, peak.integral, peak.centroid, mult
+                    )
+
+                    ic_cor = frib_event.correct_ic_time(
+                        peak, frib_params, get_frequency
+                    )
+                    # Only apply IC correction to time calibration if correction is less than the
+                    # total length of the GET window in TB
+                    if ic_cor >= 512.0:
+                        ic_cor = 0.0
             else:
-                pc.calibrate_z_position(
-                    detector_params.micromegas_time_bucket,
-                    detector_params.window_time_bucket,
-                    detector_params.detector_length,
-                    corrector,
-                )
-        else:
-            # No IC correction, so we calibrate z without it
-            pc.calibrate_z_position(
-                detector_params.micromegas_time_bucket,
-                detector_params.window_time_bucket,
-                detector_params.detector_length,
-                corrector,
-            )
-            # Get triggering IC, no Si conicidence imposed
-            ic_mult = frib_event.get_ic_multiplicity(frib_params)
-            ic_peak = frib_event.get_triggering_ic_peak(frib_params)
-            # Check multiplicity condition and existence of trigger
-            if ic_mult <= frib_params.ic_multiplicity and ic_peak is not None:
-                pc_dataset.attrs["ic_amplitude"] = ic_peak.amplitude
-                pc_dataset.attrs["ic_integral"] = ic_peak.integral
-                pc_dataset.attrs["ic_centroid"] = ic_peak.centroid
-                pc_dataset.attrs["ic_multiplicity"] = ic_mult
-
-        pc_dataset[:] = pc.cloud
+                # No IC correction, get triggering IC, no Si conicidence imposed
+                ic_mult = frib_event.get_ic_multiplicity(frib_params)
+                ic_peak = frib_event.get_triggering_ic_peak(frib_params)
+                # Check multiplicity condition and existence of trigger
+                if ic_mult <= ic_multiplicity_limit and ic_peak is not None:
+                    writer.set_ic(
+                        idx,
+                        ic_peak.amplitude,
+                        ic_peak.integral,
+                        ic_peak.centroid,
+                        ic_mult,
+                    )
+
+        pc.calibrate_z_position(
+            micromegas_tb, window_tb, detector_length, corrector, ic_cor
+        )
+        writer.write_cloud(pc)
     # End of event data
+    writer.close()
 
     # Process scaler data if it exists
     if frib_scaler_group is not None:
@@ -1,6 +1,7 @@
 from .core.config import GetParameters, DetectorParameters, FribParameters
 from .core.pad_map import PadMap
 from .core.point_cloud import PointCloud
+from .core.point_cloud_file import PointCloudWriter
 from .core.workspace import Workspace
 from .trace.get_legacy_event import GetLegacyEvent
 from .correction import create_electron_corrector, ElectronCorrector
@@ -99,8 +100,7 @@ def phase_pointcloud_legacy(
         return
 
     cloud_group = point_file.create_group("cloud")
-    cloud_group.attrs["min_event"] = min_event
-    cloud_group.attrs["max_event"] = max_event
+    writer = PointCloudWriter(cloud_group, min_event, max_event)
 
     nevents = max_event - min_event
     total: int
@@ -117,6 +117,14 @@ def phase_pointcloud_legacy(
 
     msg = StatusMessage(run, Phase.CLOUD, total, 1)  # We always increment by 1
 
+    # Gather the existing events once, rather than probing for each event
+    event_names = set(event_group.keys())
+
+    # Calibration parameters, constant over the run
+    micromegas_tb = detector_params.micromegas_time_bucket
+    window_tb = detector_params.window_time_bucket
+    detector_length = detector_params.detector_length
+
     # Process the data
     for idx in range(min_event, max_event + 1):
         count += 1
@@ -124,45 +132,32 @@ def phase_pointcloud_legacy(
             count = 0
             queue.put(msg)
 
-        event_data: h5.Dataset
-        try:
-            event_data = event_group[f"evt{idx}_data"]  # type: ignore
-        except Exception:
+        event_name = f"evt{idx}_data"
+        if event_name not in event_names:
             continue
+        event_data: h5.Dataset = event_group[event_name]  # type: ignore
 
         event = GetLegacyEvent(event_data, idx, get_params, ic_params, rng)
 
         pc = PointCloud()
         pc.load_cloud_from_get_event(event, pad_map)
-        pc.calibrate_z_position(
-            detector_params.micromegas_time_bucket,
-            detector_params.window_time_bucket,
-            detector_params.detector_length,
-            corrector,
-        )
-
-        pc_dataset = cloud_group.create_dataset(
-            f"cloud_{pc.event_number}", shape=pc.cloud.shape, dtype=np.float64
-        )
-
-        # default IC settings
-        pc_dataset.attrs["ic_amplitude"] = -1.0
-        pc_dataset.attrs["ic_integral"] = -1.0
-        pc_dataset.attrs["ic_centroid"] = -1.0
-        pc_dataset.attrs["ic_multiplicity"] = -1.0
+        pc.calibrate_z_position(micromegas_tb, window_tb, detector_length, corrector)
 
         # Set IC if present; take first non-garbage peak
         if event.ic_trace is not None:
             # No way to disentangle multiplicity
             for peak in event.ic_trace.get_peaks():
-                pc_dataset.attrs["ic_amplitude"] = peak.amplitude
-                pc_dataset.attrs["ic_integral"] = peak.integral
-                pc_dataset.attrs["ic_centroid"] = peak.centroid
-                pc_dataset.attrs["ic_multiplicity"] = (
-                    event.ic_trace.get_number_of_peaks()
+                writer.set_ic(
+                    idx,
+                    peak.amplitude,
+                    peak.integral,
+                    peak.centroid,
+                    event.ic_trace.get_number_of_peaks(),
                 )
                 break
 
-        pc_dataset[:] = pc.cloud
+        writer.write_cloud(pc)
+
+    writer.close()
 
     spyral_info(__name__, "Phase 1 complete")
@@ -260,7 +260,7 @@ class FribEvent:
         )
 
 
-@njit
+@njit(cache=True)
 def preprocess_frib_traces(
     traces: np.ndarray, baseline_window_scale: float
 ) -> np.ndarray:
@@ -101,7 +101,7 @@ class GetEvent:
         return self.name != INVALID_EVENT_NAME and self.number != INVALID_EVENT_NUMBER
 
 
-@njit
+@njit(cache=True)
 def preprocess_traces(traces: np.ndarray, baseline_window_scale: float) -> np.ndarray:
     """JIT-ed Method for pre-cleaning the trace data in bulk before doing trace analysis
 
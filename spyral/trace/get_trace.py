@@ -17,7 +17,17 @@ class GetTrace:
     trace: ndarray
         The trace data
     peaks: list[Peak]
-        The peaks found in the trace
+        The peaks found in the trace, created from the peak arrays on first access
+    peak_centroids: ndarray
+        The centroids of the peaks found in the trace
+    peak_amplitudes: ndarray
+        The amplitudes of the peaks found in the trace
+    peak_integrals: ndarray
+        The integrals of the peaks found in the trace
+    peak_positive_inflections: ndarray
+        The left edges of the peaks found in the trace
+    peak_negative_inflections: ndarray
+        The right edges of the peaks found in the trace
     hw_id: HardwareID
         The hardware ID for the pad this trace came from
 
@@ -37,6 +47,8 @@ class GetTrace:
         Get the number of peaks found in the trace
     get_peaks(params: GetParameters) -> list[Peak]
         Get the peaks found in the trace
+    get_peaks_as_arrays() -> tuple[ndarray, ndarray, ndarray]
+        Get the peak centroids, amplitudes, and integrals as arrays
     """
 
     def __init__(
@@ -65,7 +77,12 @@ class GetTrace:
             An instance of this class
         """
         self.trace: np.ndarray = np.empty(0, dtype=np.int32)
-        self.peaks: list[Peak] = []
+        self.peak_centroids: np.ndarray = np.empty(0, dtype=np.float64)
+        self.peak_amplitudes: np.ndarray = np.empty(0, dtype=np.float64)
+        self.peak_integrals: np.ndarray = np.empty(0, dtype=np.float64)
+        self.peak_positive_inflections: np.ndarray = np.empty(0, dtype=np.int64)
+        self.peak_negative_inflections: np.ndarray = np.empty(0, dtype=np.int64)
+        self._peaks: list[Peak] | None = None
         self.hw_id: HardwareID = HardwareID()
         if isinstance(data, np.ndarray) and id.pad_id != INVALID_PAD_ID:
             self.set_trace_data(data, id, params, rng)
@@ -135,6 +152,8 @@ class GetTrace:
         is essentially a bin in time over which the signal is sampled. As such, the peak is identified to be on the interval
         [centroid, centroid+1). We sample over this interval to make the data represent this uncertainty.
 
+        The peak data is stored as arrays; Peak objects are only created if requested through get_peaks.
+
         Parameters
         ----------
         params: GetParameters
@@ -149,7 +168,7 @@ class GetTrace:
         if self.is_valid() == False:
             return
 
-        self.peaks.clear()
+        self._peaks = None
 
         pks, props = signal.find_peaks(
             self.trace,
@@ -158,17 +177,48 @@ class GetTrace:
             width=(1.0, params.peak_max_width),
             rel_height=rel_height,
         )
-        for idx, p in enumerate(pks):
-            peak = Peak()
-            peak.centroid = float(p) + rng.random()
-            peak.amplitude = float(self.trace[p])
-            peak.positive_inflection = int(np.floor(props["left_ips"][idx]))
-            peak.negative_inflection = int(np.ceil(props["right_ips"][idx]))
-            peak.integral = np.sum(
-                np.abs(self.trace[peak.positive_inflection : peak.negative_inflection])
-            )
-            if peak.amplitude > params.peak_threshold:
-                self.peaks.append(peak)
+        # Draw the smearing for every peak (including those below threshold) to keep the random stream
+        centroids = pks + rng.random(len(pks))
+        amplitudes = self.trace[pks].astype(np.float64)
+        positive_inflections = np.floor(props["left_ips"]).astype(np.int64)
+        negative_inflections = np.ceil(props["right_ips"]).astype(np.int64)
+        # Integrate each peak from the running sum of the trace
+        running_sum = np.zeros(len(self.trace) + 1, dtype=np.int64)
+        np.cumsum(np.abs(self.trace), out=running_sum[1:])
+        integrals = (
+            running_sum[negative_inflections] - running_sum[positive_inflections]
+        ).astype(np.float64)
+
+        mask = amplitudes > params.peak_threshold
+        self.peak_centroids = centroids[mask]
+        self.peak_amplitudes = amplitudes[mask]
+        self.peak_integrals = integrals[mask]
+        self.peak_positive_inflections = positive_inflections[mask]
+        self.peak_negative_inflections = negative_inflections[mask]
+
+    @property
+    def peaks(self) -> list[Peak]:
+        """The peaks found in the trace as Peak objects
+
+        Created from the peak arrays on first access
+
+        Returns
+        -------
+        list[Peak]
+            The peaks found in the trace
+        """
+        if self._peaks is None:
+            self._peaks = [
+                Peak(
+                    centroid=float(self.peak_centroids[idx]),
+                    positive_inflection=int(self.peak_positive_inflections[idx]),
+                    negative_inflection=int(self.peak_negative_inflections[idx]),
+                    amplitude=float(self.peak_amplitudes[idx]),
+                    integral=float(self.peak_integrals[idx]),
+                )
+                for idx in range(len(self.peak_centroids))
+            ]
+        return self._peaks
 
     def get_number_of_peaks(self) -> int:
         """Get the number of peaks found in the trace
@@ -178,7 +228,7 @@ class GetTrace:
         int
             Number of found peaks
         """
-        return len(self.peaks)
+        return len(self.peak_centroids)
 
     def get_peaks(self) -> list[Peak]:
         """Get the peaks found in the trace
@@ -189,3 +239,15 @@ class GetTrace:
             The peaks found in the trace
         """
         return self.peaks
+
+    def get_peaks_as_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the peaks found in the trace as arrays
+
+        Useful for bulk operations on the peak data (i.e. filling a point cloud)
+
+        Returns
+        -------
+        tuple[ndarray, ndarray, ndarray]
+            The peak (centroids, amplitudes, integrals), each of length get_number_of_peaks()
+        """
+        return (self.peak_centroids, self.peak_amplitudes, self.peak_integrals)